@@ -0,0 +1,126 @@
+"""Index of known org-roam nodes for fast mention matching in transcripts."""
+
+import functools
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+import ahocorasick
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROAM_DB_PATH = Path.home() / '.emacs.d' / 'org-roam.db'
+
+def _unquote(value: str) -> str:
+    """Undo the elisp string quoting org-roam uses for stored values."""
+    if len(value) >= 2 and value.startswith('"') and value.endswith('"'):
+        return value[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+    return value
+
+class EntityIndex:
+    """Case-insensitive multi-pattern matcher over org-roam node titles.
+
+    All titles are compiled into one Aho-Corasick automaton so a transcript
+    is scanned once regardless of how many nodes exist.
+    """
+
+    def __init__(self, entities: Iterable[Tuple[str, str]]):
+        """Build the automaton.
+
+        When two different nodes share a title (ignoring case), the first
+        one wins and the collision is logged.
+
+        Args:
+            entities: (node_id, title) pairs; aliases may repeat a node_id
+        """
+        self._automaton = ahocorasick.Automaton()
+        for node_id, title in entities:
+            key = title.strip().lower()
+            if not key:
+                continue
+            existing = self._automaton.get(key, None)
+            if existing is not None:
+                if existing[1] != node_id:
+                    logger.warning(
+                        f"Title '{title.strip()}' of node {node_id} collides with "
+                        f"node {existing[1]}; keeping {existing[1]}"
+                    )
+                continue
+            self._automaton.add_word(key, (len(key), node_id, title.strip()))
+        self._empty = len(self._automaton) == 0
+        if not self._empty:
+            self._automaton.make_automaton()
+
+    @classmethod
+    def from_roam_db(cls, db_path: Path) -> 'EntityIndex':
+        """Load node titles and aliases from an org-roam SQLite database."""
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            rows = conn.execute("SELECT id, title FROM nodes").fetchall()
+            rows += conn.execute("SELECT node_id, alias FROM aliases").fetchall()
+        finally:
+            conn.close()
+        return cls(
+            (_unquote(node_id), _unquote(title))
+            for node_id, title in rows
+            if node_id and title
+        )
+
+    def find(self, text: str) -> list[Tuple[int, int, str, str]]:
+        """Find whole-word mentions of known nodes in text.
+
+        Overlapping matches are resolved leftmost-longest.
+
+        Returns:
+            Sorted, non-overlapping (start, end, node_id, title) spans
+        """
+        if self._empty:
+            return []
+
+        haystack = text.lower()
+        offsets = None
+        if len(haystack) != len(text):
+            # Some characters lowercase to several (e.g. "İ"); lowercase per
+            # character and map haystack positions back to text positions
+            pieces = []
+            offsets = []
+            for index, char in enumerate(text):
+                lowered = char.lower()
+                pieces.append(lowered)
+                offsets.extend([index] * len(lowered))
+            haystack = ''.join(pieces)
+
+        candidates = []
+        for end_index, (length, node_id, title) in self._automaton.iter(haystack):
+            start, end = end_index - length + 1, end_index + 1
+            if offsets is not None:
+                start, end = offsets[start], offsets[end - 1] + 1
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            if end < len(text) and text[end].isalnum():
+                continue
+            candidates.append((start, end, node_id, title))
+
+        candidates.sort(key=lambda span: (span[0], span[0] - span[1]))
+        spans = []
+        cursor = 0
+        for span in candidates:
+            if span[0] >= cursor:
+                spans.append(span)
+                cursor = span[1]
+        return spans
+
+@functools.lru_cache(maxsize=1)
+def get_entity_index() -> Optional[EntityIndex]:
+    """Load the entity index from the org-roam database, if one exists.
+
+    The database path can be overridden with $VOICE_TO_ORG_ROAM_DB.
+    """
+    db_path = Path(os.environ.get('VOICE_TO_ORG_ROAM_DB', DEFAULT_ROAM_DB_PATH))
+    if not db_path.exists():
+        return None
+    try:
+        return EntityIndex.from_roam_db(db_path)
+    except sqlite3.Error:
+        return None
@@ -1,9 +1,15 @@
 """Models for text processing."""
-from .base_model import BaseModel
-from .openai_model import OpenAIModel
+from .base import BaseModel
 from .local_model import LocalModel
+from .semantic_cache import SemanticCache
 from .model_factory import create_model
 from .types import ModelType
 
-__all__ = ['BaseModel', 'OpenAIModel', 'LocalModel', 'create_model', 'ModelType']
+__all__ = ['BaseModel', 'OpenAIModel', 'LocalModel', 'SemanticCache', 'create_model', 'ModelType']
 
+def __getattr__(name):
+    # Importing openai is slow, so only pay for it when OpenAIModel is used
+    if name == 'OpenAIModel':
+        from .openai_model import OpenAIModel
+        return OpenAIModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,59 @@
+"""Shared OpenAI client instances."""
+
+import asyncio
+import openai
+
+MAX_RETRIES = 4
+
+# Connection limits must be built with the same httpx package the SDK uses,
+# which it does not export under a public name
+_Limits = type(openai.DEFAULT_CONNECTION_LIMITS)
+
+# Pooled connections are bound to the event loop that opened them, so each
+# loop gets its own pool: loop -> (http client, {api_key: AsyncOpenAI}).
+# Entries must be released with close_async_clients() before the loop ends.
+_loop_clients = {}
+
+def _new_http_client() -> openai.DefaultAsyncHttpxClient:
+    return openai.DefaultAsyncHttpxClient(
+        limits=_Limits(
+            max_keepalive_connections=20,
+            max_connections=50,
+            keepalive_expiry=60
+        ),
+        timeout=openai.Timeout(30.0, connect=5.0)
+    )
+
+def get_async_client(api_key: str) -> openai.AsyncOpenAI:
+    """Return the pooled AsyncOpenAI client for api_key on the running loop.
+
+    Clients on the same event loop share one HTTP connection pool, so TLS
+    sessions opened by one model instance are reused by the next. A new
+    loop (e.g. each asyncio.run call) gets a fresh pool, which must be
+    closed with close_async_clients() before that loop ends. Rate limits (429),
+    server errors, timeouts and connection errors are retried by the SDK
+    with exponential backoff and jitter.
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    if loop not in _loop_clients:
+        _loop_clients[loop] = (_new_http_client(), {})
+    http_client, clients = _loop_clients[loop]
+    if api_key not in clients:
+        clients[api_key] = openai.AsyncOpenAI(
+            api_key=api_key,
+            max_retries=MAX_RETRIES,
+            http_client=http_client
+        )
+    return clients[api_key]
+
+async def close_async_clients() -> None:
+    """Close the connection pool of the running loop and forget its clients.
+
+    Later calls to get_async_client() on the same loop open a new pool.
+    """
+    entry = _loop_clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[0].aclose()
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 
 @dataclass
 class ModelConfig:
@@ -51,7 +51,8 @@ class BaseModel(ABC):
     async def process_text(
         self,
         raw_text: str,
-        system_prompt: str
+        system_prompt: str,
+        context: Optional[str] = None
     ) -> str:
         """Process raw text input using the AI model.
 
@@ -61,6 +62,8 @@ class BaseModel(ABC):
         Args:
             raw_text: The input text to process
             system_prompt: Instructions for how to process the text
+            context: Optional per-request context, kept separate from
+                system_prompt so the prompt stays identical across calls
 
         Returns:
             The processed text output
@@ -69,3 +72,37 @@ class BaseModel(ABC):
             Exception: If text processing fails
         """
         pass
+
+    async def stream_text(
+        self,
+        raw_text: str,
+        system_prompt: str,
+        context: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Process raw text, yielding the output in chunks as it is produced.
+
+        The default implementation yields the full result of process_text
+        as a single chunk; models that support streaming override this.
+
+        Args:
+            raw_text: The input text to process
+            system_prompt: Instructions for how to process the text
+            context: Optional per-request context
+
+        Yields:
+            Successive pieces of the processed text output
+        """
+        yield await self.process_text(raw_text, system_prompt, context)
+
+    async def aclose(self) -> None:
+        """Release resources held by the model.
+
+        Call before the event loop the model was used on ends. The default
+        implementation does nothing.
+        """
+
+    async def __aenter__(self) -> 'BaseModel':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
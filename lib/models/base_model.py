@@ -1,8 +0,0 @@
-"""Base class for text processing models."""
-
-class BaseModel:
-    """Base class for text processing models."""
-
-    def process_text(self, text: str) -> str:
-        """Process text input into formatted output."""
-        raise NotImplementedError
\ No newline at end of file
@@ -1,18 +1,27 @@
 """Local text processing model."""
 
-from .base_model import BaseModel
+import re
+from typing import Optional
+from .base import BaseModel
+
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
 
 class LocalModel(BaseModel):
     """Simple local text processing model."""
 
-    def process_text(self, text: str) -> str:
-        """Process text locally with simple formatting."""
-        lines = text.split('. ')
-        formatted = []
-
-        for line in lines:
-            if line:
-                formatted.append(f"* {line.strip()}")
-
-        return '\n'.join(formatted)
+    async def process_text(
+        self,
+        raw_text: str,
+        system_prompt: str,
+        context: Optional[str] = None
+    ) -> str:
+        """Process text locally with simple formatting.
 
+        The system prompt and context are ignored; sentences become
+        top-level org headings.
+        """
+        return '\n'.join(
+            f"* {sentence.strip()}"
+            for sentence in _SENTENCE_BREAK.split(raw_text)
+            if sentence and not sentence.isspace()
+        )
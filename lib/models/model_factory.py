@@ -1,17 +1,30 @@
 """Factory for creating text processing models."""
 
 from typing import Optional
-from .base_model import BaseModel
-from .openai_model import OpenAIModel
+from .base import BaseModel
 from .local_model import LocalModel
+from .semantic_cache import SemanticCache
 from .types import ModelType
 
-def create_model(model_type: ModelType, api_key: Optional[str] = None) -> BaseModel:
-    """Create a model instance of the specified type."""
+def create_model(
+    model_type: ModelType,
+    api_key: Optional[str] = None,
+    use_cache: bool = False
+) -> BaseModel:
+    """Create a model instance of the specified type.
+
+    With use_cache, OpenAI models answer repeated or near-identical
+    requests from a local SemanticCache.
+    """
     if model_type in (ModelType.GPT35, ModelType.GPT4):
         if not api_key:
             raise ValueError("API key required for OpenAI models")
-        return OpenAIModel(api_key, model_type)
+        # Deferred so local-only runs don't import openai
+        from .openai_model import OpenAIModel
+        model = OpenAIModel(api_key, model_type)
+        if use_cache:
+            model.cache = SemanticCache(embed=model.embed)
+        return model
     elif model_type == ModelType.LOCAL:
         return LocalModel()
     else:
@@ -1,25 +1,247 @@
 """OpenAI-based text processing model."""
 
-from typing import Optional
-import openai
-from .base_model import BaseModel
+import asyncio
+import json
+from typing import AsyncIterator, Optional
+from ._client import close_async_clients, get_async_client
+from .base import BaseModel, ModelConfig
+from .semantic_cache import SemanticCache
 from .types import ModelType
 
 class OpenAIModel(BaseModel):
     """OpenAI-based text processing model."""
 
-    def __init__(self, api_key: str, model_type: ModelType = ModelType.GPT35):
-        self.client = openai.OpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model_type: ModelType = ModelType.GPT35,
+        config: Optional[ModelConfig] = None,
+        max_concurrency: int = 4,
+        cache: Optional[SemanticCache] = None
+    ):
+        super().__init__(config)
+        self.api_key = api_key
         self.model_name = model_type.value
+        self.max_concurrency = max_concurrency
+        self.cache = cache
 
-    def process_text(self, text: str) -> str:
-        """Process text using OpenAI API."""
-        response = self.client.chat.completions.create(
+    @property
+    def client(self):
+        """The pooled AsyncOpenAI client for the running event loop."""
+        return get_async_client(self.api_key)
+
+    async def aclose(self) -> None:
+        """Close the running loop's pooled connections.
+
+        Other models sharing the pool on this loop get a new one on their
+        next request.
+        """
+        await close_async_clients()
+
+    async def process_text(
+        self,
+        raw_text: str,
+        system_prompt: str,
+        context: Optional[str] = None
+    ) -> str:
+        """Process text using OpenAI API, consulting the cache if configured."""
+        if self.cache is None:
+            return await self._raw_call(raw_text, system_prompt, context)
+        cache_text = f"Context: {context}\n{raw_text}" if context else raw_text
+        return await self.cache.get_or_compute(
+            self.model_name,
+            system_prompt,
+            cache_text,
+            lambda: self._raw_call(raw_text, system_prompt, context)
+        )
+
+    async def stream_text(
+        self,
+        raw_text: str,
+        system_prompt: str,
+        context: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Stream the response from the OpenAI API as it arrives.
+
+        When a cache is configured the full (possibly cached) response is
+        yielded as a single chunk instead.
+        """
+        if self.cache is not None:
+            yield await self.process_text(raw_text, system_prompt, context)
+            return
+
+        stream = await self.client.chat.completions.create(
             model=self.model_name,
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that formats text into org-mode notes."},
-                {"role": "user", "content": text}
-            ]
+            messages=self._build_messages(raw_text, system_prompt, context),
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def embed(self, text: str) -> list[float]:
+        """Return the text-embedding-3-small embedding for text."""
+        response = await self.client.embeddings.create(
+            model="text-embedding-3-small",
+            input=text
+        )
+        return response.data[0].embedding
+
+    @staticmethod
+    def _build_messages(raw_text: str, system_prompt: str, context: Optional[str] = None) -> list[dict]:
+        # The system prompt always goes first and unmodified so repeated
+        # calls share a cacheable prefix.
+        messages = [{"role": "system", "content": system_prompt}]
+        if context:
+            messages.append({"role": "user", "content": f"Context: {context}"})
+        messages.append({"role": "user", "content": raw_text})
+        return messages
+
+    async def _raw_call(self, raw_text: str, system_prompt: str, context: Optional[str] = None) -> str:
+        response = await self.client.chat.completions.create(
+            model=self.model_name,
+            messages=self._build_messages(raw_text, system_prompt, context)
         )
         return response.choices[0].message.content
 
+    async def process_many(self, texts: list[str], system_prompt: str) -> list[str]:
+        """Process several texts concurrently, bounded by max_concurrency.
+
+        Args:
+            texts: The input texts to process
+            system_prompt: Instructions shared by every request
+
+        Returns:
+            Processed outputs in the same order as texts
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _bounded(text: str) -> str:
+            async with semaphore:
+                return await self.process_text(text, system_prompt)
+
+        return await asyncio.gather(*(_bounded(text) for text in texts))
+
+    async def process_text_many(self, texts: list[str], system_prompt: str) -> list[str]:
+        """Process several short texts in a single chat completion request.
+
+        The texts are enumerated in one user message and the model is asked
+        for a JSON object whose "items" array holds one output per input.
+        JSON mode is requested on models that support it.
+
+        Args:
+            texts: The input texts to process
+            system_prompt: Instructions applied to every item
+
+        Returns:
+            Processed outputs aligned by index with texts
+
+        Raises:
+            ValueError: If the response does not contain one string per input
+        """
+        if not texts:
+            return []
+
+        enumerated = "\n".join(f"{i}. {text}" for i, text in enumerate(texts, start=1))
+        request = {
+            "model": self.model_name,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {
+                    "role": "user",
+                    "content": (
+                        "Process each item and return a JSON object of the form "
+                        '{"items": [...]} with one string per item, in order:\n'
+                        f"{enumerated}"
+                    )
+                }
+            ]
+        }
+        # gpt-4 does not support JSON mode; it relies on the prompt and the
+        # validation below
+        if self.model_name != ModelType.GPT4.value:
+            request["response_format"] = {"type": "json_object"}
+        response = await self.client.chat.completions.create(**request)
+
+        try:
+            items = json.loads(response.choices[0].message.content)["items"]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"Malformed batched response: {e}")
+        if not isinstance(items, list):
+            raise ValueError(f"Expected a list of items in batched response, got {type(items).__name__}")
+        if len(items) != len(texts) or not all(isinstance(item, str) for item in items):
+            raise ValueError(f"Expected {len(texts)} strings in batched response, got {len(items)} items")
+        return items
+
+    async def submit_batch(self, items: list[tuple[str, str]]) -> str:
+        """Submit texts to the OpenAI Batch API for offline processing.
+
+        Args:
+            items: (raw_text, system_prompt) pairs; each index becomes its custom_id
+
+        Returns:
+            The ID of the created batch
+        """
+        lines = []
+        for index, (raw_text, system_prompt) in enumerate(items):
+            lines.append(json.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model_name,
+                    "messages": self._build_messages(raw_text, system_prompt)
+                }
+            }))
+
+        batch_file = await self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    async def wait_for_batch(self, batch_id: str, poll_interval: float = 30.0) -> list[Optional[str]]:
+        """Poll a batch until it finishes and return its outputs.
+
+        Args:
+            batch_id: ID returned by submit_batch
+            poll_interval: Seconds to wait between status checks
+
+        Returns:
+            Processed outputs ordered like the submitted items; None for
+            items that failed
+
+        Raises:
+            RuntimeError: If the batch failed, expired or was cancelled
+        """
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"Batch {batch_id} ended with status {batch.status}")
+            await asyncio.sleep(poll_interval)
+
+        total = batch.request_counts.total if batch.request_counts else 0
+        results: list[Optional[str]] = [None] * total
+        if not batch.output_file_id:
+            return results
+
+        output = await self.client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            index = int(record["custom_id"])
+            if index >= len(results):
+                results.extend([None] * (index + 1 - len(results)))
+            results[index] = response["body"]["choices"][0]["message"]["content"]
+        return results
@@ -0,0 +1,154 @@
+"""Response cache for text processing models."""
+
+import hashlib
+import json
+import math
+import sqlite3
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'voice-to-org' / 'sem_cache.sqlite'
+
+Embedder = Callable[[str], Awaitable[list[float]]]
+
+class SemanticCache:
+    """Caches model responses keyed by model, system prompt and input text.
+
+    Lookups first try an exact match on a SHA-256 of the model, prompt and
+    text. If an embedder is configured, a miss falls back to comparing the
+    embedding of the request against cached entries for the same model and
+    system prompt and reuses any response whose cosine similarity reaches the
+    threshold. Entries expire after ttl seconds and the least recently
+    used entries are evicted beyond max_entries.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        ttl: float = 600.0,
+        max_entries: int = 256,
+        similarity_threshold: float = 0.95,
+        embed: Optional[Embedder] = None
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite file holding cached entries
+            ttl: Seconds before an entry expires
+            max_entries: Maximum number of entries kept
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            embed: Optional coroutine returning an embedding for a string
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.embed = embed
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                prompt_hash TEXT NOT NULL,
+                embedding TEXT,
+                response TEXT NOT NULL,
+                created REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._db.commit()
+
+    @staticmethod
+    def _hash(*parts: str) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    @staticmethod
+    def _normalize(vector: list[float]) -> list[float]:
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else vector
+
+    def _touch(self, key: str, now: float) -> None:
+        self._db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, key))
+        self._db.commit()
+
+    def _evict(self, now: float) -> None:
+        self._db.execute("DELETE FROM entries WHERE created < ?", (now - self.ttl,))
+        self._db.execute(
+            """
+            DELETE FROM entries WHERE key NOT IN (
+                SELECT key FROM entries ORDER BY last_used DESC LIMIT ?
+            )
+            """,
+            (self.max_entries,)
+        )
+        self._db.commit()
+
+    def _find_similar(self, prompt_hash: str, embedding: list[float], now: float) -> Optional[tuple[str, str]]:
+        best: Optional[tuple[float, str, str]] = None
+        rows = self._db.execute(
+            "SELECT key, embedding, response FROM entries "
+            "WHERE prompt_hash = ? AND embedding IS NOT NULL AND created >= ?",
+            (prompt_hash, now - self.ttl)
+        )
+        for key, stored, response in rows:
+            score = sum(a * b for a, b in zip(embedding, json.loads(stored)))
+            if score >= self.similarity_threshold and (best is None or score > best[0]):
+                best = (score, key, response)
+        return (best[1], best[2]) if best else None
+
+    async def get_or_compute(
+        self,
+        model: str,
+        system_prompt: str,
+        text: str,
+        compute: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Return a cached response for the request, computing it on a miss.
+
+        Args:
+            model: Name of the model producing the response
+            system_prompt: Instructions sent with the request
+            text: The input text
+            compute: Coroutine factory producing the response on a miss
+
+        Returns:
+            The cached or freshly computed response
+        """
+        now = time.time()
+        key = self._hash(model, system_prompt, text)
+        prompt_hash = self._hash(model, system_prompt)
+
+        row = self._db.execute(
+            "SELECT response FROM entries WHERE key = ? AND created >= ?",
+            (key, now - self.ttl)
+        ).fetchone()
+        if row:
+            self._touch(key, now)
+            return row[0]
+
+        embedding = None
+        if self.embed is not None:
+            embedding = self._normalize(await self.embed(text))
+            similar = self._find_similar(prompt_hash, embedding, now)
+            if similar:
+                self._touch(similar[0], now)
+                return similar[1]
+
+        response = await compute()
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+            (key, prompt_hash, json.dumps(embedding) if embedding else None, response, now, now)
+        )
+        self._evict(now)
+        return response
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._db.close()
@@ -1,27 +1,83 @@
 #!/usr/bin/env python3
 import sys
 import os
+import asyncio
+import fcntl
+import functools
+import json
 from pathlib import Path
 from typing import Optional, Tuple
-from text_processor import TextProcessor
+from text_processor import TextProcessor, ProcessingConfig, GENERAL_SYSTEM_PROMPT, MEETING_SYSTEM_PROMPT
 from models.types import ModelType
 from models.model_factory import create_model
+from entity_index import EntityIndex, get_entity_index
 import re
 
+def _uppercase_class() -> str:
+    """Build a regex character class of the uppercase letters in the BMP.
+
+    The re module has no Unicode category classes, so this keeps non-ASCII
+    capitals such as "É" matching as str.isupper() does.
+    """
+    ranges = []
+    for code in range(0x10000):
+        if chr(code).isupper():
+            if ranges and ranges[-1][1] == code - 1:
+                ranges[-1][1] = code
+            else:
+                ranges.append([code, code])
+    return '[' + ''.join(
+        re.escape(chr(low)) if low == high else f"{re.escape(chr(low))}-{re.escape(chr(high))}"
+        for low, high in ranges
+    ) + ']'
+
+_UPPER = _uppercase_class()
+# Capitalized words joined by spaces only, so runs never span lines or tabs
+_PROPER_RUN = re.compile(rf'\b{_UPPER}[\w-]*(?:[ ]+{_UPPER}[\w-]*)*\b')
+
+BATCH_SPOOL_PATH = Path.home() / '.cache' / 'voice-to-org' / 'batch.jsonl'
+BATCH_SUBMITTING_PATH = BATCH_SPOOL_PATH.with_name('batch.submitting.jsonl')
+BATCH_LOCK_PATH = BATCH_SPOOL_PATH.with_name('batch.lock')
+BATCH_MANIFEST_DIR = BATCH_SPOOL_PATH.with_name('batches')
+
+@functools.lru_cache(maxsize=1)
+def get_api_key_path() -> Path:
+    """Get the path of the OpenAI API key config file."""
+    return Path.home() / '.config' / 'voice-to-org' / 'openai.key'
+
+@functools.lru_cache(maxsize=1)
 def get_api_key() -> Optional[str]:
-    """Get OpenAI API key from environment or config file."""
+    """Get OpenAI API key from environment or config file.
+
+    The result is cached for the life of the process; call configure()
+    after changing $HOME or OPENAI_API_KEY.
+    """
     # First try environment variable
     api_key = os.environ.get('OPENAI_API_KEY')
     if api_key:
         return api_key
 
     # Then try config file in home directory
-    config_path = Path.home() / '.config' / 'voice-to-org' / 'openai.key'
+    config_path = get_api_key_path()
     if config_path.exists():
         return config_path.read_text().strip()
 
     return None
 
+def configure() -> None:
+    """Reset cached configuration so it is re-read on next use."""
+    get_api_key_path.cache_clear()
+    get_api_key.cache_clear()
+    get_entity_index.cache_clear()
+
+async def _process_with(processor: TextProcessor, text: str, note_type: str) -> str:
+    try:
+        if note_type == 'meeting':
+            return (await processor.process_meeting_notes(text)).content
+        return (await processor.process_general_notes(text)).content
+    finally:
+        await processor.aclose()
+
 def process_text(text: str, note_type: str = 'general') -> str:
     """Process raw text input into formatted org-mode content."""
     # Try to use OpenAI if API key is available, otherwise fall back to local
@@ -29,54 +85,174 @@ def process_text(text: str, note_type: str = 'general') -> str:
     model_type = ModelType.GPT35 if api_key else ModelType.LOCAL
 
     try:
-        model = create_model(model_type, api_key)
-        processor = TextProcessor(model)
+        model_params = {'api_key': api_key} if api_key else {}
+        processor = TextProcessor(ProcessingConfig(model_type=model_type, model_params=model_params))
 
-        if note_type == 'meeting':
-            return processor.format_meeting_notes(text)
-        return processor.format_general_notes(text)
+        return asyncio.run(_process_with(processor, text, note_type))
     except Exception as e:
         print(f"Error in text processing: {e}", file=sys.stderr)
         # Fall back to simple formatting
         return f"* {text}"
 
-def extract_links(text: str) -> Tuple[str, list]:
+def queue_batch(text: str, note_type: str = 'general') -> None:
+    """Append a note to the batch spool file for the next submission."""
+    BATCH_SPOOL_PATH.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps({'note_type': note_type, 'text': text}) + '\n'
+    while True:
+        with BATCH_SPOOL_PATH.open('a', encoding='utf-8') as spool:
+            fcntl.flock(spool, fcntl.LOCK_EX)
+            # If the spool was moved aside for submission after we opened
+            # it, write to a fresh spool instead
+            try:
+                current = os.stat(BATCH_SPOOL_PATH)
+            except FileNotFoundError:
+                continue
+            if current.st_ino != os.fstat(spool.fileno()).st_ino:
+                continue
+            spool.write(line)
+            return
+
+async def _submit_batch(items: list) -> str:
+    async with create_model(ModelType.GPT35, get_api_key()) as model:
+        return await model.submit_batch(items)
+
+async def _wait_for_batch(processor: TextProcessor, batch_id: str) -> list:
+    try:
+        return await processor.model.wait_for_batch(batch_id)
+    finally:
+        await processor.aclose()
+
+def submit_queued_batch() -> Optional[str]:
+    """Submit all spooled notes to the OpenAI Batch API.
+
+    Intended to run once per cron tick. The spool is renamed aside before
+    it is read, so notes queued during submission go into a new spool for
+    the next tick. The renamed file is only removed once the batch has
+    been created; after a failed submission it is retried first on the
+    next tick. A tick that starts while another is still submitting does
+    nothing. The submitted entries are kept as a manifest in
+    BATCH_MANIFEST_DIR until the batch is collected. Returns the batch ID,
+    or None if nothing was submitted.
     """
-    Extract potential org-roam links from text and format them.
-    Returns the processed text and a list of link candidates.
+    BATCH_LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with BATCH_LOCK_PATH.open('w') as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            print("Batch submission already in progress", file=sys.stderr)
+            return None
+
+        if not BATCH_SUBMITTING_PATH.exists():
+            try:
+                BATCH_SPOOL_PATH.rename(BATCH_SUBMITTING_PATH)
+            except FileNotFoundError:
+                return None
+
+        with BATCH_SUBMITTING_PATH.open('r', encoding='utf-8') as spool:
+            # Wait for any writer that still holds the old spool open
+            fcntl.flock(spool, fcntl.LOCK_EX)
+            entries = [json.loads(line) for line in spool if line.strip()]
+
+        if not entries:
+            BATCH_SUBMITTING_PATH.unlink(missing_ok=True)
+            return None
+
+        items = [
+            (
+                entry['text'],
+                MEETING_SYSTEM_PROMPT if entry['note_type'] == 'meeting' else GENERAL_SYSTEM_PROMPT
+            )
+            for entry in entries
+        ]
+        batch_id = asyncio.run(_submit_batch(items))
+        BATCH_MANIFEST_DIR.mkdir(parents=True, exist_ok=True)
+        (BATCH_MANIFEST_DIR / f"{batch_id}.jsonl").write_text(
+            ''.join(json.dumps(entry) + '\n' for entry in entries),
+            encoding='utf-8'
+        )
+        BATCH_SUBMITTING_PATH.unlink(missing_ok=True)
+        return batch_id
+
+def collect_batch(batch_id: str) -> list:
+    """Wait for a submitted batch and return its processed notes.
+
+    Each result carries the note_type and text it was queued with, and is
+    finished the same way as inline processing (meeting header, tags).
+    Failed items have content None. The batch manifest is removed once
+    the results have been collected.
     """
-    # Look for potential entity names that should be links
+    manifest_path = BATCH_MANIFEST_DIR / f"{batch_id}.jsonl"
+    entries = []
+    if manifest_path.exists():
+        entries = [
+            json.loads(line)
+            for line in manifest_path.read_text(encoding='utf-8').splitlines()
+            if line.strip()
+        ]
+
+    processor = TextProcessor(ProcessingConfig(
+        model_type=ModelType.GPT35,
+        model_params={'api_key': get_api_key()}
+    ))
+    results = asyncio.run(_wait_for_batch(processor, batch_id))
+
+    collected = []
+    for index in range(max(len(results), len(entries))):
+        entry = entries[index] if index < len(entries) else {}
+        result = results[index] if index < len(results) else None
+        note_type = entry.get('note_type')
+        processed = None
+        if result is not None:
+            if note_type == 'meeting':
+                processed = processor.build_meeting_notes(result)
+            else:
+                processed = processor.build_general_notes(result)
+        collected.append({
+            'custom_id': str(index),
+            'note_type': note_type,
+            'text': entry.get('text'),
+            'content': processed.content if processed else None,
+            'tags': processed.tags if processed else []
+        })
+
+    manifest_path.unlink(missing_ok=True)
+    return collected
+
+def _link_proper_nouns(segment: str, parts: list, link_candidates: dict) -> None:
+    """Append segment to parts, wrapping capitalized runs as org-roam links."""
     # This is a basic implementation - you might want to use NLP for better detection
-    words = text.split()
-    link_candidates = []
-
-    # Convert appropriate words/phrases to org-roam links
-    processed_words = []
-    i = 0
-    while i < len(words):
-        # Check for multi-word proper nouns
-        current_phrase = words[i]
-        if current_phrase[0].isupper():
-            j = i + 1
-            while j < len(words) and words[j][0].isupper():
-                current_phrase += " " + words[j]
-                j += 1
-
-            if j > i + 1:  # Multi-word proper noun found
-                link_candidates.append(current_phrase)
-                processed_words.append(f"[[{current_phrase}]]")
-                i = j
-                continue
+    cursor = 0
+    for match in _PROPER_RUN.finditer(segment):
+        # Collapse repeated spaces, as the original word-split version did
+        phrase = ' '.join(match.group().split())
+        parts.append(segment[cursor:match.start()])
+        parts.append(f"[[{phrase}]]")
+        link_candidates[phrase] = None
+        cursor = match.end()
+    parts.append(segment[cursor:])
 
-        # Single proper nouns and known entities
-        if words[i][0].isupper():
-            link_candidates.append(words[i])
-            processed_words.append(f"[[{words[i]}]]")
-        else:
-            processed_words.append(words[i])
-        i += 1
+def extract_links(text: str, entities: Optional[EntityIndex] = None) -> Tuple[str, list]:
+    """
+    Extract potential org-roam links from text and format them.
+    Mentions of known org-roam nodes become id links; other runs of
+    capitalized words become title links.
+    Returns the processed text and a list of distinct link candidates
+    in order of first mention.
+    """
+    if entities is None:
+        entities = get_entity_index()
 
-    return " ".join(processed_words), link_candidates
+    parts = []
+    link_candidates: dict[str, None] = {}
+    cursor = 0
+    for start, end, node_id, title in entities.find(text) if entities else []:
+        _link_proper_nouns(text[cursor:start], parts, link_candidates)
+        parts.append(f"[[id:{node_id}][{title}]]")
+        link_candidates[title] = None
+        cursor = end
+    _link_proper_nouns(text[cursor:], parts, link_candidates)
+
+    return "".join(parts), list(link_candidates)
 
 def format_for_daily(text: str) -> str:
     """Format text for a daily note entry."""
@@ -91,8 +267,27 @@ def format_for_note(text: str) -> str:
     return processed_text
 
 def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--batch":
+        queue_batch(sys.argv[3], sys.argv[2])
+        return
+
+    if len(sys.argv) == 2 and sys.argv[1] == "--submit-batch":
+        batch_id = submit_queued_batch()
+        if batch_id:
+            print(batch_id)
+        return
+
+    if len(sys.argv) == 3 and sys.argv[1] == "--collect-batch":
+        # One JSON line per queued note, in queue order; content is null
+        # for notes the batch failed to process
+        for result in collect_batch(sys.argv[2]):
+            print(json.dumps(result))
+        return
+
     if len(sys.argv) != 3:
-        print("Usage: process_input.py <note_type> <content>", file=sys.stderr)
+        print("Usage: process_input.py [--batch] <note_type> <content>", file=sys.stderr)
+        print("       process_input.py --submit-batch", file=sys.stderr)
+        print("       process_input.py --collect-batch <batch_id>", file=sys.stderr)
         sys.exit(1)
 
     note_type = sys.argv[1]
@@ -4,9 +4,9 @@ import sys
 import pyaudio
 from pathlib import Path
 import logging
-import queue
-import threading
-import time
+import re
+import asyncio
+import signal
 
 # Set up logging to stderr
 logging.basicConfig(
@@ -22,50 +22,67 @@ class VoiceRecorder:
     def __init__(self, device_index=None, stop_phrases=None):
         self.device_index = device_index
         self.stop_phrases = stop_phrases or ["stop recording", "end recording", "finish recording"]
+        self._stop_re = re.compile(
+            '|'.join(re.escape(phrase) for phrase in self.stop_phrases),
+            re.IGNORECASE
+        )
         self.recognizer = sr.Recognizer()
-        self.audio_queue = queue.Queue()
+        self.audio_queue = None
         self.is_recording = False
         self.text_segments = []
 
-    def record_chunk(self, source):
-        """Record a chunk of audio and add it to the queue."""
+    def stop(self):
+        """Ask the recording loop to finish after the current chunk."""
+        logger.debug("Recording stopped by user")
+        self.is_recording = False
+
+    def _record_chunks_blocking(self, source, loop):
+        """Record chunks of audio and hand them to the event loop's queue.
+
+        Runs in a worker thread; a None sentinel is queued when recording ends.
+        """
         try:
             while self.is_recording:
                 logger.debug("Listening for next chunk...")
                 try:
                     # Use a shorter timeout for chunks to allow for stop checking
                     audio = self.recognizer.listen(source, timeout=2, phrase_time_limit=None)
-                    self.audio_queue.put(audio)
+                    loop.call_soon_threadsafe(self.audio_queue.put_nowait, audio)
                 except sr.WaitTimeoutError:
                     continue  # Keep listening if timeout
         except Exception as e:
             logger.error(f"Error in recording thread: {e}")
             self.is_recording = False
-
-    def process_audio(self):
-        """Process audio chunks from the queue."""
-        while self.is_recording or not self.audio_queue.empty():
+        finally:
+            loop.call_soon_threadsafe(self.audio_queue.put_nowait, None)
+
+    async def _process_audio_async(self):
+        """Process audio chunks from the queue until recording ends."""
+        while True:
+            audio = await self.audio_queue.get()
+            if audio is None:
+                break
             try:
-                audio = self.audio_queue.get(timeout=1)
-                text = self.recognizer.recognize_google(audio)
+                text = await asyncio.to_thread(self.recognizer.recognize_google, audio)
                 logger.debug(f"Recognized: {text}")
 
                 # Check for stop command
-                if any(phrase in text.lower() for phrase in self.stop_phrases):
+                if self._stop_re.search(text):
                     logger.debug("Stop command detected")
                     self.is_recording = False
                     break
 
                 self.text_segments.append(text)
-            except queue.Empty:
-                continue
             except sr.UnknownValueError:
                 logger.debug("Could not understand audio chunk")
             except Exception as e:
                 logger.error(f"Error processing audio: {e}")
 
-    def record(self):
+    async def record(self):
         """Start recording with microphone."""
+        loop = asyncio.get_running_loop()
+        self.audio_queue = asyncio.Queue()
+
         with sr.Microphone(device_index=self.device_index) as source:
             logger.debug("\nAdjusting for ambient noise... Please wait...")
             self.recognizer.adjust_for_ambient_noise(source, duration=2)
@@ -73,22 +90,15 @@ class VoiceRecorder:
             logger.debug("\nListening... Say 'stop recording' when finished.")
             self.is_recording = True
 
-            # Start recording thread
-            record_thread = threading.Thread(target=self.record_chunk, args=(source,))
-            process_thread = threading.Thread(target=self.process_audio)
-
-            record_thread.start()
-            process_thread.start()
-
+            # Ctrl-C ends the recording but keeps what was transcribed so far
+            loop.add_signal_handler(signal.SIGINT, self.stop)
             try:
-                while self.is_recording:
-                    time.sleep(0.1)  # Small sleep to prevent CPU hogging
-            except KeyboardInterrupt:
-                logger.debug("Recording stopped by user")
-                self.is_recording = False
-
-            record_thread.join()
-            process_thread.join()
+                await asyncio.gather(
+                    asyncio.to_thread(self._record_chunks_blocking, source, loop),
+                    self._process_audio_async()
+                )
+            finally:
+                loop.remove_signal_handler(signal.SIGINT)
 
             return " ".join(self.text_segments)
 
@@ -127,7 +137,7 @@ def record_voice() -> str:
 
     try:
         recorder = VoiceRecorder(device_index=device_index)
-        text = recorder.record()
+        text = asyncio.run(recorder.record())
         if text:
             # Don't print here, let main() handle output
             return text
@@ -3,13 +3,12 @@
 
 import logging
 import asyncio
+import re
+import time
 from datetime import datetime
-from typing import Optional, TypeVar, Type, Dict, Any
+from typing import Optional, TypeVar, Type, Dict, Any, Callable
 from dataclasses import dataclass, field
 from enum import Enum
-from models.base_model import BaseModel
-from models.openai_model import OpenAIModel
-from models.local_model import LocalModel
 from models.model_factory import create_model, ModelType
 
 # Configure logging
@@ -19,6 +18,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+ORG_TIMESTAMP_FORMAT = "<%Y-%m-%d %a %H:%M>"
+
+_FILETAGS_RE = re.compile(r'^:FILETAGS:[ \t]*:([^:\n]+(?::[^:\n]+)*):[ \t\r]*$', re.MULTILINE)
+
+# System prompts are kept byte-identical across calls so providers with
+# automatic prompt prefix caching can reuse them; per-request context is
+# sent as a separate message instead of being appended here.
+MEETING_SYSTEM_PROMPT = """Convert the following meeting notes into org-mode format.
+Include:
+- Appropriate headers and structure
+- Timestamps for key points
+- Any action items or TODOs
+- Proper org syntax
+- Extract any proper nouns as [[id:placeholder][Name]] links
+- Identify and tag key topics"""
+
+GENERAL_SYSTEM_PROMPT = """Convert the following notes into org-mode format.
+- Use appropriate headers and structure
+- Identify and format any links to other notes
+- Extract key concepts and create org-roam style links
+- Maintain any existing org-roam links"""
+
 class ProcessingError(Exception):
     """Custom exception for text processing errors."""
     pass
@@ -61,6 +82,10 @@ class TextProcessor:
             logger.error(f"Failed to initialize model: {str(e)}")
             raise ProcessingError(f"Model initialization failed: {str(e)}")
 
+    async def aclose(self) -> None:
+        """Release the model's resources; call before the event loop ends."""
+        await self.model.aclose()
+
     async def process_meeting_notes(self, raw_text: str) -> ProcessedText:
         """Process raw meeting notes into structured org-mode format.
 
@@ -71,36 +96,8 @@ class TextProcessor:
             ProcessedText object containing formatted content and metadata
         """
         try:
-            # Format the system prompt for meeting notes
-            system_prompt = """
-            Convert the following meeting notes into org-mode format.
-            Include:
-            - Appropriate headers and structure
-            - Timestamps for key points
-            - Any action items or TODOs
-            - Proper org syntax
-            - Extract any proper nouns as [[id:placeholder][Name]] links
-            - Identify and tag key topics
-            """
-
-            formatted_text = await self.model.process_text(raw_text, system_prompt)
-
-            # Add timestamp header
-            timestamp = self.format_timestamp()
-            content = f"* Meeting Notes {timestamp}\n{formatted_text}"
-
-            # Extract tags including default ones
-            tags = self._extract_tags(formatted_text)
-            tags.extend(["meeting"] + self.config.default_tags)
-
-            return ProcessedText(
-                content=content,
-                tags=list(set(tags)),  # Deduplicate tags
-                properties={
-                    "CATEGORY": "meetings",
-                    "CREATED": timestamp
-                }
-            )
+            formatted_text = await self.model.process_text(raw_text, MEETING_SYSTEM_PROMPT)
+            return self.build_meeting_notes(formatted_text)
 
         except Exception as e:
             error_msg = f"Error processing meeting notes: {str(e)}"
@@ -111,44 +108,100 @@ class TextProcessor:
                 error=error_msg
             )
 
-    async def process_general_notes(self, raw_text: str, context: Optional[str] = None) -> ProcessedText:
+    async def process_general_notes(
+        self,
+        raw_text: str,
+        context: Optional[str] = None,
+        on_title: Optional[Callable[[str], None]] = None
+    ) -> ProcessedText:
         """Process general notes into org-mode format with optional context.
 
+        The model response is streamed, and the title is parsed as soon as
+        the first line has arrived.
+
         Args:
             raw_text: The raw text input from voice transcription
             context: Optional context about the note (type, related topics, etc.)
+            on_title: Optional callback invoked with the title before the
+                rest of the response has been received
 
         Returns:
             ProcessedText object containing formatted content and metadata
         """
         try:
-            # Format system prompt for general notes
-            system_prompt = """
-            Convert the following notes into org-mode format.
-            - Use appropriate headers and structure
-            - Identify and format any links to other notes
-            - Extract key concepts and create org-roam style links
-            - Maintain any existing org-roam links
-            """
+            chunks = []
+            title = None
+            first_line = ""
+            async for chunk in self.model.stream_text(raw_text, GENERAL_SYSTEM_PROMPT, context=context):
+                chunks.append(chunk)
+                if title is None:
+                    # Extract potential title from first line
+                    first_line += chunk
+                    if '\n' in first_line:
+                        title = self._title_from_line(first_line.split('\n', 1)[0])
+                        if on_title:
+                            on_title(title)
+
+            formatted_text = "".join(chunks)
+            if title is None:
+                title = self._title_from_line(formatted_text)
+                if on_title:
+                    on_title(title)
+
+            return self.build_general_notes(formatted_text, title)
 
-            if context:
-                system_prompt += f"\nContext: {context}"
+        except Exception as e:
+            logger.error(f"Error processing general notes: {str(e)}")
+            raise
 
-            formatted_text = await self.model.process_text(raw_text, system_prompt)
+    def build_meeting_notes(self, formatted_text: str) -> ProcessedText:
+        """Wrap model output for meeting notes with header, tags and properties.
 
-            # Extract potential title from first line
-            first_line = formatted_text.split('\n')[0]
-            title = first_line.lstrip('*# ').strip()
+        Args:
+            formatted_text: Model output for MEETING_SYSTEM_PROMPT
 
-            return ProcessedText(
-                content=formatted_text,
-                title=title,
-                tags=self._extract_tags(formatted_text)
-            )
+        Returns:
+            ProcessedText object containing formatted content and metadata
+        """
+        # Add timestamp header
+        timestamp = self.format_timestamp()
+        content = f"* Meeting Notes {timestamp}\n{formatted_text}"
+
+        # Extract tags including default ones
+        tags = self._extract_tags(formatted_text)
+        tags.extend(["meeting"] + self.config.default_tags)
+
+        return ProcessedText(
+            content=content,
+            tags=list(set(tags)),  # Deduplicate tags
+            properties={
+                "CATEGORY": "meetings",
+                "CREATED": timestamp
+            }
+        )
+
+    def build_general_notes(self, formatted_text: str, title: Optional[str] = None) -> ProcessedText:
+        """Wrap model output for general notes with title and tags.
 
-        except Exception as e:
-            logger.error(f"Error processing general notes: {str(e)}")
-            raise
+        Args:
+            formatted_text: Model output for GENERAL_SYSTEM_PROMPT
+            title: Title if already parsed, otherwise taken from the first line
+
+        Returns:
+            ProcessedText object containing formatted content and metadata
+        """
+        if title is None:
+            title = self._title_from_line(formatted_text.split('\n', 1)[0])
+        return ProcessedText(
+            content=formatted_text,
+            title=title,
+            tags=self._extract_tags(formatted_text)
+        )
+
+    @staticmethod
+    def _title_from_line(line: str) -> str:
+        """Turn the first line of a formatted note into a title."""
+        return line.lstrip('*# ').strip()
 
     def _extract_tags(self, text: str) -> list[str]:
         """Extract org-mode tags from text content.
@@ -159,11 +212,12 @@ class TextProcessor:
         Returns:
             List of extracted tags
         """
-        tags = []
-        for line in text.split('\n'):
-            if line.startswith(':FILETAGS:'):
-                tags.extend(tag.strip() for tag in line.split(':')[2:-1])
-        return tags
+        return [
+            tag.strip()
+            for match in _FILETAGS_RE.finditer(text)
+            for tag in match.group(1).split(':')
+            if tag.strip()
+        ]
 
     @staticmethod
     def format_timestamp(dt: Optional[datetime] = None) -> str:
@@ -176,6 +230,6 @@ class TextProcessor:
             Formatted org-mode timestamp string
         """
         if dt is None:
-            dt = datetime.now()
-        return dt.strftime("<%Y-%m-%d %a %H:%M>")
+            return time.strftime(ORG_TIMESTAMP_FORMAT)
+        return dt.strftime(ORG_TIMESTAMP_FORMAT)
 
@@ -0,0 +1,36 @@
+import logging
+
+from entity_index import EntityIndex
+
+
+def test_matches_whole_words_case_insensitively():
+    index = EntityIndex([('u1', 'Deep Work')])
+    assert index.find('Reading deep work today') == [(8, 17, 'u1', 'Deep Work')]
+
+
+def test_ignores_matches_inside_words():
+    index = EntityIndex([('u1', 'Al'), ('u2', 'work')])
+    assert index.find('Also homework and workshops') == []
+
+
+def test_overlaps_resolve_leftmost_longest():
+    index = EntityIndex([('u1', 'Atomic'), ('u2', 'Atomic Habits'), ('u3', 'Habits Book')])
+    assert index.find('atomic habits book') == [(0, 13, 'u2', 'Atomic Habits')]
+
+
+def test_empty_index():
+    assert EntityIndex([]).find('anything at all') == []
+
+
+def test_offsets_survive_length_changing_lowercase():
+    index = EntityIndex([('u1', 'John Smith')])
+    text = 'İstanbul trip with John Smith'
+    assert index.find(text) == [(19, 29, 'u1', 'John Smith')]
+    assert text[19:29] == 'John Smith'
+
+
+def test_title_collision_keeps_first_node(caplog):
+    with caplog.at_level(logging.WARNING):
+        index = EntityIndex([('u1', 'Inbox'), ('u2', 'inbox'), ('u1', 'INBOX')])
+    assert index.find('check inbox') == [(6, 11, 'u1', 'Inbox')]
+    assert len(caplog.records) == 1
@@ -0,0 +1,41 @@
+import pytest
+
+import process_input
+from process_input import extract_links
+
+
+@pytest.fixture(autouse=True)
+def no_roam_db(monkeypatch, tmp_path):
+    monkeypatch.setenv('VOICE_TO_ORG_ROAM_DB', str(tmp_path / 'missing.db'))
+    process_input.configure()
+    yield
+    process_input.configure()
+
+
+def test_links_capitalized_runs():
+    text, candidates = extract_links("met John Smith at Acme-Corp, then lunch.")
+    assert text == "met [[John Smith]] at [[Acme-Corp]], then lunch."
+    assert candidates == ["John Smith", "Acme-Corp"]
+
+
+def test_runs_do_not_span_lines():
+    text, candidates = extract_links("Met with Alice\nBob said")
+    assert text == "[[Met]] with [[Alice]]\n[[Bob]] said"
+    assert candidates == ["Met", "Alice", "Bob"]
+
+
+def test_non_ascii_capitals():
+    text, candidates = extract_links("lunch with Émile Zola")
+    assert text == "lunch with [[Émile Zola]]"
+    assert candidates == ["Émile Zola"]
+
+
+def test_candidates_are_deduplicated():
+    _, candidates = extract_links("John met John and Mary")
+    assert candidates == ["John", "Mary"]
+
+
+def test_runs_join_on_single_spaces():
+    text, candidates = extract_links("The quick Brown\tFox met John  Smith")
+    assert text == "[[The]] quick [[Brown]]\t[[Fox]] met [[John Smith]]"
+    assert candidates == ["The", "Brown", "Fox", "John Smith"]
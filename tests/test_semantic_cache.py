@@ -0,0 +1,93 @@
+import pytest
+
+from models import semantic_cache
+from models.semantic_cache import SemanticCache
+
+
+class Compute:
+    """Counts calls and returns a distinct response for each."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return f"response {self.calls}"
+
+
+@pytest.fixture
+def compute():
+    return Compute()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(semantic_cache.time, 'time', lambda: now[0])
+    return now
+
+
+def make_cache(tmp_path, **kwargs):
+    return SemanticCache(path=tmp_path / 'cache.sqlite', **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_exact_hit_reuses_response(tmp_path, compute):
+    cache = make_cache(tmp_path)
+    first = await cache.get_or_compute('gpt-4', 'prompt', 'text', compute)
+    second = await cache.get_or_compute('gpt-4', 'prompt', 'text', compute)
+    assert first == second == "response 1"
+    assert compute.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_key_includes_model_and_prompt(tmp_path, compute):
+    cache = make_cache(tmp_path)
+    await cache.get_or_compute('gpt-4', 'prompt', 'text', compute)
+    assert await cache.get_or_compute('gpt-3.5-turbo', 'prompt', 'text', compute) == "response 2"
+    assert await cache.get_or_compute('gpt-4', 'other prompt', 'text', compute) == "response 3"
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl(tmp_path, compute, clock):
+    cache = make_cache(tmp_path, ttl=60)
+    await cache.get_or_compute('gpt-4', 'prompt', 'text', compute)
+    clock[0] += 59
+    assert await cache.get_or_compute('gpt-4', 'prompt', 'text', compute) == "response 1"
+    clock[0] += 2
+    assert await cache.get_or_compute('gpt-4', 'prompt', 'text', compute) == "response 2"
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted(tmp_path, compute, clock):
+    cache = make_cache(tmp_path, max_entries=2)
+    await cache.get_or_compute('gpt-4', 'prompt', 'a', compute)
+    clock[0] += 1
+    await cache.get_or_compute('gpt-4', 'prompt', 'b', compute)
+    clock[0] += 1
+    # Touch "a" so "b" becomes least recently used
+    await cache.get_or_compute('gpt-4', 'prompt', 'a', compute)
+    clock[0] += 1
+    await cache.get_or_compute('gpt-4', 'prompt', 'c', compute)
+    assert compute.calls == 3
+
+    assert await cache.get_or_compute('gpt-4', 'prompt', 'a', compute) == "response 1"
+    assert await cache.get_or_compute('gpt-4', 'prompt', 'b', compute) == "response 4"
+
+
+@pytest.mark.asyncio
+async def test_similarity_threshold(tmp_path, compute):
+    vectors = {
+        'original': [1.0, 0.0],
+        'close': [0.99, 0.1],
+        'far': [0.8, 0.6],
+    }
+
+    async def embed(text):
+        return vectors[text]
+
+    cache = make_cache(tmp_path, embed=embed, similarity_threshold=0.95)
+    await cache.get_or_compute('gpt-4', 'prompt', 'original', compute)
+    assert await cache.get_or_compute('gpt-4', 'prompt', 'close', compute) == "response 1"
+    assert await cache.get_or_compute('gpt-4', 'prompt', 'far', compute) == "response 2"
+    assert await cache.get_or_compute('gpt-3.5-turbo', 'prompt', 'close', compute) == "response 3"
@@ -0,0 +1,22 @@
+import pytest
+
+from models.types import ModelType
+from text_processor import ProcessingConfig, TextProcessor
+
+
+@pytest.fixture
+def processor():
+    return TextProcessor(ProcessingConfig(model_type=ModelType.LOCAL))
+
+
+def test_extract_tags(processor):
+    text = "* Title\n:FILETAGS: :work:ideas:\nbody\n"
+    assert processor._extract_tags(text) == ["work", "ideas"]
+
+
+def test_extract_tags_stays_on_one_line(processor):
+    assert processor._extract_tags(":FILETAGS:\n:foo:bar:\n") == []
+
+
+def test_extract_tags_crlf(processor):
+    assert processor._extract_tags(":FILETAGS: :a:b:\r\nx") == ["a", "b"]